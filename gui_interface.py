@@ -5,54 +5,162 @@ Provides the graphical user interface for voice analysis
 
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
-from voice_analyzer import analyze_voice
+import tkinter.font as tkfont
+import collections
+import concurrent.futures
+import queue
+import logging
 import threading
 import os
 
+# Debug output is off by default; set GUI_LOGLEVEL=DEBUG to enable it
+log = logging.getLogger('gui')
+_log_level = os.environ.get('GUI_LOGLEVEL', 'WARNING').upper()
+if not isinstance(logging.getLevelName(_log_level), int):
+    # An unknown level name must not stop the GUI from starting
+    _log_level = 'WARNING'
+log.setLevel(_log_level)
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter('[GUI] %(message)s'))
+log.addHandler(_log_handler)
+
+# Fixed window size
+WINDOW_WIDTH = 650
+WINDOW_HEIGHT = 550
+
+# Audio file extensions accepted by select_file
+AUDIO_EXTS = frozenset({'.wav', '.mp3', '.flac', '.ogg', '.m4a'})
+
+# Remembers the folder of the last selected file between sessions
+LAST_DIR_FILE = os.path.join(os.path.expanduser('~'), '.voice_detector_last_dir')
+
+# Maximum number of analysis results kept in the per-file cache
+RESULT_CACHE_SIZE = 32
+
+# Background thread warming up the analysis engine (see start_warmup)
+_warmup_thread = None
+
+# Color scheme
+COLORS = {
+    'primary': '#2c3e50',
+    'success': '#27ae60',
+    'danger': '#e74c3c',
+    'senior': '#9b59b6',
+    'info': '#3498db',
+    'light': '#ecf0f1',
+    'dark': '#34495e',
+    'bg': '#f0f0f0'
+}
+
+# Fonts used by the UI: name -> (size, weight), all in Arial
+FONT_SPECS = {
+    'header_title': (22, 'bold'),
+    'value': (20, 'bold'),
+    'message': (18, 'bold'),
+    'heading': (16, 'bold'),
+    'large': (14, 'bold'),
+    'body_bold': (11, 'bold'),
+    'body': (10, 'normal'),
+    'small': (9, 'normal'),
+    'icon': (40, 'normal'),
+    'emotion_icon': (45, 'normal')
+}
+
+# Icons shown for each detected emotion
+EMOTION_ICONS = {
+    'Happy': '😊',
+    'Sad': '😢',
+    'Angry': '😠',
+    'Neutral': '😐'
+}
+
 class VoiceDetectorGUI:
     """Main GUI Application Class"""
     
     def __init__(self, root):
         self.root = root
+        
+        # Keep the window hidden until it is fully laid out
+        self.root.withdraw()
+        
         self.root.title("Voice Age & Emotion Detector")
-        self.root.geometry("650x550")
-        self.root.resizable(False, False)
+        self.root.protocol('WM_DELETE_WINDOW', self.on_close)
         
-        # Configure colors
-        self.colors = {
-            'primary': '#2c3e50',
-            'success': '#27ae60',
-            'danger': '#e74c3c',
-            'senior': '#9b59b6',
-            'info': '#3498db',
-            'light': '#ecf0f1',
-            'dark': '#34495e',
-            'bg': '#f0f0f0'
-        }
+        # Size and center the window before any widgets are packed
+        x = (self.root.winfo_screenwidth() - WINDOW_WIDTH) // 2
+        y = (self.root.winfo_screenheight() - WINDOW_HEIGHT) // 2
+        self.root.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}+{x}+{y}")
+        self.root.resizable(False, False)
         
-        self.root.configure(bg=self.colors['bg'])
+        self.root.configure(bg=COLORS['bg'])
         
-        # Audio file path
+        # Audio file path and its os.stat result
         self.audio_path = None
+        self._audio_stat = None
+        
+        # Folder the file dialog opens in
+        self._last_dir = load_last_dir()
+        
+        # Streaming analysis function, imported on first use
+        self._analyze_voice_streaming = None
+        
+        # LRU cache of results keyed by (path, size, mtime_ns)
+        self._result_cache = collections.OrderedDict()
+        
+        # Persistent single worker, reused for every analysis
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix='analyzer'
+        )
+        
+        # Set once the window is closing; stops work being handed to Tk
+        self._closing = False
+        
+        # Held from the click until the result (or error) is displayed
+        self._busy = threading.Lock()
+        
+        # Result box currently packed, and a pending swap (see show_box)
+        self._visible_box = None
+        self._swap_id = None
+        
+        # Pending progress bar tick (see _progress_tick)
+        self._tick_id = None
+        
+        # (callback, argument) pairs drained on the Tk main thread, and
+        # the pending poll that drains them while an analysis runs
+        self._ui_queue = queue.SimpleQueue()
+        self._poll_id = None
         
         # Build the UI
         self.setup_ui()
         
+        # Show the finished window
+        self.root.deiconify()
+        
     def setup_ui(self):
         """Setup all UI components"""
         
+        # Fonts are created once and shared by all widgets
+        self._fonts = {
+            name: tkfont.Font(family='Arial', size=size, weight=weight)
+            for name, (size, weight) in FONT_SPECS.items()
+        }
+        
         # Header Section
         self.create_header()
         
         # Main Content
         self.create_content()
         
+        # Result Boxes
+        self.create_result_boxes()
+        
         # Footer
         self.create_footer()
         
     def create_header(self):
         """Create header with title"""
-        header_frame = tk.Frame(self.root, bg=self.colors['primary'], height=90)
+        header_frame = tk.Frame(self.root, bg=COLORS['primary'], height=90)
         header_frame.pack(fill='x')
         header_frame.pack_propagate(False)
         
@@ -60,9 +168,9 @@ class VoiceDetectorGUI:
         title_label = tk.Label(
             header_frame,
             text="🎤 Voice Age & Emotion Detector",
-            font=('Arial', 22, 'bold'),
+            font=self._fonts['header_title'],
             fg='white',
-            bg=self.colors['primary']
+            bg=COLORS['primary']
         )
         title_label.pack(pady=15)
         
@@ -70,15 +178,15 @@ class VoiceDetectorGUI:
         subtitle_label = tk.Label(
             header_frame,
             text="AI-Powered Voice Analysis System",
-            font=('Arial', 10),
+            font=self._fonts['body'],
             fg='#bdc3c7',
-            bg=self.colors['primary']
+            bg=COLORS['primary']
         )
         subtitle_label.pack()
         
     def create_content(self):
         """Create main content area"""
-        content_frame = tk.Frame(self.root, bg=self.colors['bg'])
+        content_frame = tk.Frame(self.root, bg=COLORS['bg'])
         content_frame.pack(pady=20, padx=30, fill='both', expand=True)
         
         # Instructions Section
@@ -91,7 +199,7 @@ class VoiceDetectorGUI:
         self.create_action_section(content_frame)
         
         # Results Section
-        self.result_frame = tk.Frame(content_frame, bg=self.colors['bg'])
+        self.result_frame = tk.Frame(content_frame, bg=COLORS['bg'])
         self.result_frame.pack(pady=15, fill='both', expand=True)
         
     def create_instructions(self, parent):
@@ -102,9 +210,9 @@ class VoiceDetectorGUI:
         title = tk.Label(
             instruction_frame,
             text="📋 Instructions",
-            font=('Arial', 11, 'bold'),
+            font=self._fonts['body_bold'],
             bg='white',
-            fg=self.colors['dark']
+            fg=COLORS['dark']
         )
         title.pack(anchor='w', padx=15, pady=(10, 5))
         
@@ -119,7 +227,7 @@ class VoiceDetectorGUI:
             label = tk.Label(
                 instruction_frame,
                 text=instruction,
-                font=('Arial', 9),
+                font=self._fonts['small'],
                 bg='white',
                 fg='#555',
                 justify='left'
@@ -130,15 +238,15 @@ class VoiceDetectorGUI:
         
     def create_file_section(self, parent):
         """Create file selection section"""
-        file_frame = tk.Frame(parent, bg=self.colors['bg'])
+        file_frame = tk.Frame(parent, bg=COLORS['bg'])
         file_frame.pack(pady=15)
         
         # File display label
         self.file_label = tk.Label(
             file_frame,
             text="📁 No file selected",
-            font=('Arial', 10),
-            bg=self.colors['light'],
+            font=self._fonts['body'],
+            bg=COLORS['light'],
             fg='#7f8c8d',
             width=50,
             height=2,
@@ -151,8 +259,8 @@ class VoiceDetectorGUI:
         select_btn = tk.Button(
             file_frame,
             text="📂 Select Audio File",
-            font=('Arial', 11, 'bold'),
-            bg=self.colors['info'],
+            font=self._fonts['body_bold'],
+            bg=COLORS['info'],
             fg='white',
             activebackground='#2980b9',
             activeforeground='white',
@@ -167,15 +275,15 @@ class VoiceDetectorGUI:
         
     def create_action_section(self, parent):
         """Create action buttons section"""
-        action_frame = tk.Frame(parent, bg=self.colors['bg'])
+        action_frame = tk.Frame(parent, bg=COLORS['bg'])
         action_frame.pack(pady=10)
         
         # Analyze button
         self.analyze_btn = tk.Button(
             action_frame,
             text="🎯 Analyze Voice",
-            font=('Arial', 14, 'bold'),
-            bg=self.colors['success'],
+            font=self._fonts['large'],
+            bg=COLORS['success'],
             fg='white',
             activebackground='#229954',
             activeforeground='white',
@@ -193,7 +301,7 @@ class VoiceDetectorGUI:
         reset_btn = tk.Button(
             action_frame,
             text="🔄 Reset",
-            font=('Arial', 11, 'bold'),
+            font=self._fonts['body_bold'],
             bg='#95a5a6',
             fg='white',
             activebackground='#7f8c8d',
@@ -210,56 +318,193 @@ class VoiceDetectorGUI:
         # Progress bar (initially hidden)
         self.progress = ttk.Progressbar(
             parent,
-            mode='indeterminate',
+            mode='determinate',
             length=400
         )
         
     def create_footer(self):
         """Create footer"""
-        footer_frame = tk.Frame(self.root, bg=self.colors['primary'], height=35)
+        footer_frame = tk.Frame(self.root, bg=COLORS['primary'], height=35)
         footer_frame.pack(side='bottom', fill='x')
         
         footer_label = tk.Label(
             footer_frame,
             text="Developed with ❤️ for ML Challenge 2026",
-            font=('Arial', 9),
+            font=self._fonts['small'],
             fg='white',
-            bg=self.colors['primary']
+            bg=COLORS['primary']
         )
         footer_label.pack(pady=8)
         
+    def create_result_boxes(self):
+        """Build the result boxes once; they are packed on demand"""
+        self.create_rejection_box()
+        self.create_age_box()
+        self.create_senior_box()
+        
+    def create_rejection_box(self):
+        """Create the rejection box shown for female voices"""
+        self._rejection_box = tk.Frame(
+            self.result_frame,
+            bg=COLORS['danger'],
+            relief='solid',
+            borderwidth=3
+        )
+        
+        icon_label = tk.Label(
+            self._rejection_box,
+            text="❌",
+            font=self._fonts['icon'],
+            bg=COLORS['danger'],
+            fg='white'
+        )
+        icon_label.pack(pady=(20, 10))
+        
+        message_label = tk.Label(
+            self._rejection_box,
+            text="Upload male voice",
+            font=self._fonts['message'],
+            bg=COLORS['danger'],
+            fg='white'
+        )
+        message_label.pack(pady=(0, 20))
+        
+        info_label = tk.Label(
+            self._rejection_box,
+            text="This system only processes male voices",
+            font=self._fonts['body'],
+            bg=COLORS['danger'],
+            fg='#f5f5f5'
+        )
+        info_label.pack(pady=(0, 15))
+        
+    def create_age_box(self):
+        """Create the age detection result box"""
+        self._age_box = tk.Frame(
+            self.result_frame,
+            bg=COLORS['success'],
+            relief='solid',
+            borderwidth=3
+        )
+        
+        icon_label = tk.Label(
+            self._age_box,
+            text="✅",
+            font=self._fonts['icon'],
+            bg=COLORS['success'],
+            fg='white'
+        )
+        icon_label.pack(pady=(15, 10))
+        
+        title_label = tk.Label(
+            self._age_box,
+            text="Analysis Complete",
+            font=self._fonts['heading'],
+            bg=COLORS['success'],
+            fg='white'
+        )
+        title_label.pack()
+        
+        self._age_value_label = tk.Label(
+            self._age_box,
+            font=self._fonts['value'],
+            bg=COLORS['success'],
+            fg='white'
+        )
+        self._age_value_label.pack(pady=(10, 20))
+        
+    def create_senior_box(self):
+        """Create the senior citizen result box with emotion"""
+        self._senior_box = tk.Frame(
+            self.result_frame,
+            bg=COLORS['senior'],
+            relief='solid',
+            borderwidth=3
+        )
+        
+        self._senior_icon_label = tk.Label(
+            self._senior_box,
+            font=self._fonts['emotion_icon'],
+            bg=COLORS['senior']
+        )
+        self._senior_icon_label.pack(pady=(15, 5))
+        
+        title_label = tk.Label(
+            self._senior_box,
+            text="Senior Citizen Detected",
+            font=self._fonts['heading'],
+            bg=COLORS['senior'],
+            fg='white'
+        )
+        title_label.pack(pady=5)
+        
+        self._senior_age_label = tk.Label(
+            self._senior_box,
+            font=self._fonts['large'],
+            bg=COLORS['senior'],
+            fg='white'
+        )
+        self._senior_age_label.pack(pady=3)
+        
+        self._senior_emotion_label = tk.Label(
+            self._senior_box,
+            font=self._fonts['large'],
+            bg=COLORS['senior'],
+            fg='white'
+        )
+        self._senior_emotion_label.pack(pady=(3, 20))
+        
     def select_file(self):
         """Open file dialog to select audio file"""
         file_path = filedialog.askopenfilename(
             title="Select Audio File",
+            initialdir=self._last_dir,
             filetypes=[
                 ("Audio Files", "*.wav *.mp3 *.flac *.ogg *.m4a"),
-                ("WAV files", "*.wav"),
-                ("MP3 files", "*.mp3"),
-                ("FLAC files", "*.flac"),
-                ("OGG files", "*.ogg"),
                 ("All files", "*.*")
             ]
         )
         
         if file_path:
+            # Reject unsupported formats before any decoding is attempted
+            ext = os.path.splitext(file_path)[1].lower()
+            if ext not in AUDIO_EXTS:
+                messagebox.showerror(
+                    "Unsupported File",
+                    f"'{ext or os.path.basename(file_path)}' is not a supported audio format.\n\n"
+                    "Please select a WAV, MP3, FLAC, OGG or M4A file."
+                )
+                return
+            
+            try:
+                audio_stat = os.stat(file_path)
+            except OSError as e:
+                messagebox.showerror("File Error", f"Cannot read the selected file:\n\n{e}")
+                return
+            
             self.audio_path = file_path
+            self._audio_stat = audio_stat
+            
+            # Reopen the dialog in this folder next time
+            self._last_dir = os.path.dirname(file_path)
+            save_last_dir(self._last_dir)
             filename = os.path.basename(file_path)
             
             # Update label
             self.file_label.config(
                 text=f"✅ Selected: {filename}",
-                fg=self.colors['success'],
+                fg=COLORS['success'],
                 bg='#d5f4e6'
             )
             
-            # Enable analyze button
-            self.analyze_btn.config(state='normal')
+            # Enable analyze button; a running job re-enables it when done
+            if not self._busy.locked():
+                self.analyze_btn.config(state='normal')
             
             # Clear previous results
             self.clear_results()
             
-            print(f"[GUI] File selected: {filename}")
+            log.debug("File selected: %s", filename)
     
     def analyze_voice_thread(self):
         """Run voice analysis in a separate thread to prevent UI freezing"""
@@ -267,49 +512,137 @@ class VoiceDetectorGUI:
             messagebox.showwarning("No File", "Please select an audio file first!")
             return
         
-        if not os.path.exists(self.audio_path):
+        # One stat checks the file still exists and refreshes the cached
+        # stat, which becomes the result cache key for this job
+        try:
+            self._audio_stat = os.stat(self.audio_path)
+        except OSError:
             messagebox.showerror("File Not Found", "The selected file no longer exists!")
             return
         
+        # Ignore clicks while an analysis is already in flight
+        if not self._busy.acquire(blocking=False):
+            return
+        
         # Disable analyze button
         self.analyze_btn.config(state='disabled')
         
         # Show progress bar
+        self.progress['value'] = 0
         self.progress.pack(pady=10)
-        self.progress.start(10)
+        self._progress_tick()
         
         # Clear previous results
         self.clear_results()
         
-        # Run analysis in separate thread
-        thread = threading.Thread(target=self.perform_analysis, daemon=True)
-        thread.start()
+        # Run analysis on the worker; the outcome is handled on the main thread.
+        # The job gets its own copy of the path and stat, so selecting or
+        # resetting while it runs cannot change what it analyzes or caches.
+        future = self._executor.submit(
+            self.perform_analysis, self.audio_path, self._audio_stat
+        )
+        future.add_done_callback(self._on_analysis_done)
+        
+        # Poll for progress and the result until the job is displayed
+        if self._poll_id is None:
+            self._poll_id = self.root.after(50, self._poll_ui_queue)
+    
+    def _on_analysis_done(self, future):
+        """Queue a finished analysis for the main thread (runs on the worker)"""
+        if not self._closing:
+            self._ui_queue.put_nowait((self._handle_future, future))
     
-    def perform_analysis(self):
-        """Perform the voice analysis (runs in separate thread)"""
+    def _handle_future(self, future):
+        """Display the outcome of a finished analysis"""
         try:
-            print(f"[GUI] Starting analysis...")
-            result = analyze_voice(self.audio_path)
-            print(f"[GUI] Analysis complete: {result['status']}")
-            
-            # Update UI in main thread
-            self.root.after(0, self.display_results, result)
-            
+            result = future.result()
         except Exception as e:
-            print(f"[GUI] Error during analysis: {e}")
-            self.root.after(0, self.display_error, str(e))
+            log.debug("Error during analysis: %s", e)
+            self.display_error(str(e))
+        else:
+            self.display_results(result)
+    
+    def perform_analysis(self, audio_path, audio_stat):
+        """Perform the voice analysis of one file (runs in the executor)"""
+        key = (audio_path, audio_stat.st_size, audio_stat.st_mtime_ns)
+        
+        # Reuse the previous result if the file is unchanged
+        if key in self._result_cache:
+            self._result_cache.move_to_end(key)
+            log.debug("Using cached result")
+            return self._result_cache[key]
+        
+        # Let a running warmup finish rather than compete with it
+        if _warmup_thread is not None:
+            _warmup_thread.join()
+        
+        # Deferred so the window appears before the audio stack is imported
+        if self._analyze_voice_streaming is None:
+            from voice_analyzer import analyze_voice_streaming
+            self._analyze_voice_streaming = analyze_voice_streaming
+        
+        log.debug("Starting analysis...")
+        result = None
+        for kind, value in self._analyze_voice_streaming(audio_path):
+            # Abandon the remaining stages if the window is being closed
+            if self._closing:
+                return None
+            
+            if kind == 'progress':
+                self._ui_queue.put_nowait((self._update_progress, value))
+            elif kind == 'result':
+                result = value
+        log.debug("Analysis complete: %s", result['status'])
+        
+        # Errors are not cached so the next click retries the analysis
+        if result['status'] != 'error':
+            self._result_cache[key] = result
+            if len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        
+        return result
+    
+    def _poll_ui_queue(self):
+        """Drain queued callbacks so all Tk calls happen on the main thread"""
+        while True:
+            try:
+                callback, arg = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            callback(arg)
+        
+        # Stop once the result has been displayed and _busy released;
+        # nothing else posts to the queue
+        if self._busy.locked():
+            self._poll_id = self.root.after(50, self._poll_ui_queue)
+        else:
+            self._poll_id = None
+    
+    def _progress_tick(self):
+        """Advance the progress bar at a fixed 10 Hz while analysis runs"""
+        self.progress['value'] = (self.progress['value'] + 5) % 100
+        self._tick_id = self.root.after(100, self._progress_tick)
+    
+    def _update_progress(self, fraction):
+        """Show real analysis progress in place of the animation"""
+        self._stop_progress_tick()
+        self.progress['value'] = fraction * 100
+    
+    def _stop_progress_tick(self):
+        """Cancel the pending progress bar tick"""
+        if self._tick_id is not None:
+            self.root.after_cancel(self._tick_id)
+            self._tick_id = None
     
     def display_results(self, result):
         """Display analysis results"""
         # Stop progress bar
-        self.progress.stop()
+        self._stop_progress_tick()
         self.progress.pack_forget()
         
         # Re-enable analyze button
         self.analyze_btn.config(state='normal')
-        
-        # Clear previous results
-        self.clear_results()
+        self._busy.release()
         
         if result['status'] == 'rejected':
             # Female voice detected
@@ -328,171 +661,123 @@ class VoiceDetectorGUI:
     
     def show_rejection(self):
         """Show rejection message for female voices"""
-        result_box = tk.Frame(
-            self.result_frame,
-            bg=self.colors['danger'],
-            relief='solid',
-            borderwidth=3
-        )
-        result_box.pack(fill='both', expand=True, padx=10, pady=10)
-        
-        icon_label = tk.Label(
-            result_box,
-            text="❌",
-            font=('Arial', 40),
-            bg=self.colors['danger'],
-            fg='white'
-        )
-        icon_label.pack(pady=(20, 10))
-        
-        message_label = tk.Label(
-            result_box,
-            text="Upload male voice",
-            font=('Arial', 18, 'bold'),
-            bg=self.colors['danger'],
-            fg='white'
-        )
-        message_label.pack(pady=(0, 20))
-        
-        info_label = tk.Label(
-            result_box,
-            text="This system only processes male voices",
-            font=('Arial', 10),
-            bg=self.colors['danger'],
-            fg='#f5f5f5'
-        )
-        info_label.pack(pady=(0, 15))
+        self.show_box(self._rejection_box)
     
     def show_age_results(self, result):
         """Show age detection results"""
-        result_box = tk.Frame(
-            self.result_frame,
-            bg=self.colors['success'],
-            relief='solid',
-            borderwidth=3
-        )
-        result_box.pack(fill='both', expand=True, padx=10, pady=10)
-        
-        icon_label = tk.Label(
-            result_box,
-            text="✅",
-            font=('Arial', 40),
-            bg=self.colors['success'],
-            fg='white'
-        )
-        icon_label.pack(pady=(15, 10))
-        
-        title_label = tk.Label(
-            result_box,
-            text="Analysis Complete",
-            font=('Arial', 16, 'bold'),
-            bg=self.colors['success'],
-            fg='white'
-        )
-        title_label.pack()
-        
-        age_label = tk.Label(
-            result_box,
-            text=f"Detected Age: {result['age']} years",
-            font=('Arial', 20, 'bold'),
-            bg=self.colors['success'],
-            fg='white'
-        )
-        age_label.pack(pady=(10, 20))
+        self._age_value_label.config(text=f"Detected Age: {result['age']} years")
+        self.show_box(self._age_box)
     
     def show_senior_results(self, result):
         """Show results for senior citizens with emotion"""
-        result_box = tk.Frame(
-            self.result_frame,
-            bg=self.colors['senior'],
-            relief='solid',
-            borderwidth=3
-        )
-        result_box.pack(fill='both', expand=True, padx=10, pady=10)
-        
-        # Emotion icons
-        emotion_icons = {
-            'Happy': '😊',
-            'Sad': '😢',
-            'Angry': '😠',
-            'Neutral': '😐'
-        }
+        emotion_icon = EMOTION_ICONS.get(result['emotion'], '🎭')
         
-        emotion_icon = emotion_icons.get(result['emotion'], '🎭')
-        
-        icon_label = tk.Label(
-            result_box,
-            text=emotion_icon,
-            font=('Arial', 45),
-            bg=self.colors['senior']
-        )
-        icon_label.pack(pady=(15, 5))
-        
-        title_label = tk.Label(
-            result_box,
-            text="Senior Citizen Detected",
-            font=('Arial', 16, 'bold'),
-            bg=self.colors['senior'],
-            fg='white'
-        )
-        title_label.pack(pady=5)
-        
-        age_label = tk.Label(
-            result_box,
-            text=f"Age: {result['age']} years",
-            font=('Arial', 14, 'bold'),
-            bg=self.colors['senior'],
-            fg='white'
-        )
-        age_label.pack(pady=3)
-        
-        emotion_label = tk.Label(
-            result_box,
-            text=f"Emotion: {result['emotion']}",
-            font=('Arial', 14, 'bold'),
-            bg=self.colors['senior'],
-            fg='white'
-        )
-        emotion_label.pack(pady=(3, 20))
+        self._senior_icon_label.config(text=emotion_icon)
+        self._senior_age_label.config(text=f"Age: {result['age']} years")
+        self._senior_emotion_label.config(text=f"Emotion: {result['emotion']}")
+        self.show_box(self._senior_box)
+    
+    def show_box(self, box):
+        """Show a prebuilt result box, swapping it in once Tk is idle"""
+        self._swap_id = self.root.after_idle(self._swap_box, box)
+    
+    def _swap_box(self, box):
+        """Replace the visible result box in one callback so Tk redraws once"""
+        self._swap_id = None
+        if self._visible_box is not None and self._visible_box is not box:
+            self._visible_box.pack_forget()
+        box.pack(fill='both', expand=True, padx=10, pady=10)
+        self._visible_box = box
     
     def clear_results(self):
         """Clear result display area"""
-        for widget in self.result_frame.winfo_children():
-            widget.destroy()
+        # Drop a swap that has not run yet so it cannot re-show a result
+        if self._swap_id is not None:
+            self.root.after_cancel(self._swap_id)
+            self._swap_id = None
+        
+        if self._visible_box is not None:
+            self._visible_box.pack_forget()
+            self._visible_box = None
     
     def reset(self):
         """Reset the application"""
         self.audio_path = None
+        self._audio_stat = None
         self.file_label.config(
             text="📁 No file selected",
             fg='#7f8c8d',
-            bg=self.colors['light']
+            bg=COLORS['light']
         )
         self.analyze_btn.config(state='disabled')
         self.clear_results()
-        self.progress.stop()
+        self._stop_progress_tick()
         self.progress.pack_forget()
-        print("[GUI] Application reset")
+        log.debug("Application reset")
+    
+    def on_close(self):
+        """Stop the analysis worker and close the window"""
+        self._closing = True
+        try:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        except TypeError:
+            # cancel_futures needs Python 3.9+
+            self._executor.shutdown(wait=False)
+        self.root.destroy()
     
     def display_error(self, error_msg):
         """Display error message"""
-        self.progress.stop()
+        self._stop_progress_tick()
         self.progress.pack_forget()
         self.analyze_btn.config(state='normal')
+        self._busy.release()
         messagebox.showerror("Error", f"An error occurred:\n\n{error_msg}")
 
+def warmup_analyzer():
+    """Import the analysis engine and run it once on synthetic data"""
+    try:
+        import voice_analyzer
+    except ImportError:
+        # Reported to the user when the analysis actually runs
+        return
+    voice_analyzer.warmup()
+
+def start_warmup():
+    """Warm up the analysis engine in a background daemon thread"""
+    global _warmup_thread
+    if _warmup_thread is None:
+        _warmup_thread = threading.Thread(target=warmup_analyzer, daemon=True)
+        _warmup_thread.start()
+
+def load_last_dir():
+    """Return the last used folder, falling back to the Documents folder"""
+    try:
+        with open(LAST_DIR_FILE, encoding='utf-8') as f:
+            last_dir = f.read().strip()
+        if os.path.isdir(last_dir):
+            return last_dir
+    except OSError:
+        pass
+    
+    documents = os.path.expanduser('~/Documents')
+    return documents if os.path.isdir(documents) else os.path.expanduser('~')
+
+def save_last_dir(directory):
+    """Persist the last used folder for the next session"""
+    try:
+        with open(LAST_DIR_FILE, 'w', encoding='utf-8') as f:
+            f.write(directory)
+    except OSError:
+        # Not remembering the folder is harmless
+        pass
+
 def start_gui():
     """Start the GUI application"""
     root = tk.Tk()
     app = VoiceDetectorGUI(root)
     
-    # Center window on screen
-    root.update_idletasks()
-    width = root.winfo_width()
-    height = root.winfo_height()
-    x = (root.winfo_screenwidth() // 2) - (width // 2)
-    y = (root.winfo_screenheight() // 2) - (height // 2)
-    root.geometry(f'{width}x{height}+{x}+{y}')
+    # Window is set up; warm up the analyzer while the user picks a file
+    start_warmup()
     
     root.mainloop()
 
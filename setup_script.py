@@ -6,6 +6,7 @@ Automates installation and verification
 import subprocess
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 def print_header(text):
     """Print formatted header"""
@@ -32,36 +33,23 @@ def install_dependencies():
     """Install required packages"""
     print_header("Installing Dependencies")
     
-    requirements = [
-        "numpy==1.24.3",
-        "librosa==0.10.1",
-        "soundfile==0.12.1",
-        "scipy==1.11.4",
-        "matplotlib==3.7.1"
-    ]
+    print("Installing packages from requirements.txt...")
     
-    print("Installing packages:")
-    for package in requirements:
-        print(f"  • {package}")
+    # Skip pip's self-version check, which is a network round-trip
+    env = dict(os.environ, PIP_DISABLE_PIP_VERSION_CHECK="1")
     
     try:
-        subprocess.check_call([
-            sys.executable, 
-            "-m", 
-            "pip", 
-            "install",
-            "--upgrade",
-            "pip"
-        ])
-        
         subprocess.check_call([
             sys.executable,
             "-m",
             "pip",
             "install",
+            "--quiet",
+            "--disable-pip-version-check",
+            "--no-input",
             "-r",
             "requirements.txt"
-        ])
+        ], env=env)
         
         print("\n✅ All dependencies installed successfully")
         return True
@@ -72,25 +60,44 @@ def install_dependencies():
         print("  pip install -r requirements.txt")
         return False
 
+def _try_import(module_name):
+    """Return True if the module can be imported"""
+    try:
+        __import__(module_name)
+        return True
+    except ImportError:
+        return False
+
 def verify_installation():
     """Verify that all packages are correctly installed"""
     print_header("Verifying Installation")
     
     packages = [
-        ("numpy", "np"),
+        ("numpy", "numpy"),
         ("librosa", "librosa"),
         ("soundfile", "soundfile"),
         ("scipy", "scipy"),
-        ("tkinter", "tk")
+        ("tkinter", "tkinter")
     ]
     
+    # Tk must be initialised on the main thread; import the rest in parallel
+    background = [p for p in packages if p[1] != "tkinter"]
+    
+    with ThreadPoolExecutor(max_workers=len(background)) as executor:
+        futures = {
+            import_name: executor.submit(_try_import, import_name)
+            for _, import_name in background
+        }
+        imported = {"tkinter": _try_import("tkinter")}
+        for import_name, future in futures.items():
+            imported[import_name] = future.result()
+    
     all_good = True
     
     for package_name, import_name in packages:
-        try:
-            __import__(import_name)
+        if imported[import_name]:
             print(f"✅ {package_name} - OK")
-        except ImportError:
+        else:
             print(f"❌ {package_name} - FAILED")
             all_good = False
     
@@ -114,10 +121,14 @@ def check_files():
         "requirements.txt"
     ]
     
+    # One directory listing instead of a stat per file
+    with os.scandir('.') as entries:
+        present = {entry.name for entry in entries}
+    
     all_present = True
     
     for filename in required_files:
-        if os.path.exists(filename):
+        if filename in present:
             print(f"✅ {filename} - Found")
         else:
             print(f"❌ {filename} - Missing")
@@ -3,6 +3,7 @@ System Test Script
 Verifies that all components are working correctly
 """
 
+import importlib.util
 import sys
 import os
 
@@ -25,21 +26,26 @@ def test_imports():
     ]
     
     failed = []
+    lines = []
     
+    # Only check that each module is installed; importing librosa here
+    # would pay numba's start-up cost before any test needs it
     for module_name, description in modules:
-        try:
-            __import__(module_name)
-            print(f"✅ {description:<40} OK")
-        except ImportError as e:
-            print(f"❌ {description:<40} FAILED")
+        if importlib.util.find_spec(module_name) is not None:
+            lines.append(f"✅ {description:<40} OK")
+        else:
+            lines.append(f"❌ {description:<40} FAILED")
             failed.append(module_name)
     
+    # One write for the whole table instead of a print per row
+    print("\n".join(lines))
+    
     if failed:
         print(f"\n⚠️  Failed imports: {', '.join(failed)}")
         print("Run: pip install -r requirements.txt")
         return False
     else:
-        print("\n✅ All modules imported successfully!")
+        print("\n✅ All modules are installed!")
         return True
 
 def test_project_files():
@@ -55,14 +61,18 @@ def test_project_files():
     ]
     
     missing = []
+    lines = []
     
     for filename, description in required_files:
-        if os.path.exists(filename):
-            size = os.path.getsize(filename) / 1024
-            print(f"✅ {description:<40} {size:.1f} KB")
-        else:
-            print(f"❌ {description:<40} MISSING")
+        try:
+            size = os.stat(filename).st_size / 1024
+        except OSError:
+            lines.append(f"❌ {description:<40} MISSING")
             missing.append(filename)
+        else:
+            lines.append(f"✅ {description:<40} {size:.1f} KB")
+    
+    print("\n".join(lines))
     
     if missing:
         print(f"\n⚠️  Missing files: {', '.join(missing)}")
@@ -92,8 +102,9 @@ def test_voice_analyzer():
             "analyze_voice"
         ]
         
-        for func in functions:
-            print(f"✅ Function '{func}' loaded successfully")
+        print("\n".join(
+            f"✅ Function '{func}' loaded successfully" for func in functions
+        ))
         
         print("\n✅ Voice Analyzer module is functional!")
         return True
@@ -137,14 +148,19 @@ def test_feature_extraction():
         duration = 1
         y = np.zeros(sr * duration)
         
+        # Compute the STFT once and share it between the features
+        S_mag = np.abs(librosa.stft(y, n_fft=2048))
+        S_power = S_mag ** 2
+        
         # Test basic librosa functions
-        mfccs = librosa.feature.mfcc(y=y, sr=sr, n_mfcc=13)
+        mel = librosa.feature.melspectrogram(S=S_power, sr=sr)
+        mfccs = librosa.feature.mfcc(S=librosa.power_to_db(mel), sr=sr, n_mfcc=13)
         print(f"✅ MFCC extraction: {mfccs.shape}")
         
-        pitches, magnitudes = librosa.piptrack(y=y, sr=sr)
+        pitches, magnitudes = librosa.piptrack(S=S_mag, sr=sr)
         print(f"✅ Pitch tracking: {pitches.shape}")
         
-        spectral_centroid = librosa.feature.spectral_centroid(y=y, sr=sr)
+        spectral_centroid = librosa.feature.spectral_centroid(S=S_mag, sr=sr)
         print(f"✅ Spectral centroid: {spectral_centroid.shape}")
         
         zcr = librosa.feature.zero_crossing_rate(y)
@@ -221,10 +237,11 @@ def main():
     # Summary
     print_section("Test Summary")
     
-    passed = sum(1 for _, result in results if result)
+    passed = 0
     total = len(results)
     
     for test_name, result in results:
+        passed += bool(result)
         status = "✅ PASSED" if result else "❌ FAILED"
         print(f"{test_name:<30} {status}")
     